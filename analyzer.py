@@ -1,7 +1,10 @@
 import os
 import json
+import hashlib
 import google.generativeai as genai
 from dotenv import load_dotenv
+from models import with_bullets
+from singleflight import SingleFlight
 
 # Load env variables for API key
 load_dotenv()
@@ -10,36 +13,42 @@ genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
 # Use a standard text model for generation
 model = genai.GenerativeModel('gemini-2.5-flash')
 
+# Identical prompts in flight at the same time (retries, the same candidate
+# generated twice) share one Gemini call
+_gemini_flight = SingleFlight()
+
+def _generate(prompt):
+    key = hashlib.sha256(prompt.encode('utf-8')).hexdigest()
+    return _gemini_flight.do(key, lambda: model.generate_content(prompt).text)
+
+def _parse_bullets(text):
+    return [b.strip().strip('-* ') for b in text.split('\n') if b.strip().strip('-* ')]
+
 def process_experience_with_gemini(experience_list):
     if not experience_list:
         return []
 
     processed = []
     for exp in experience_list:
+        # Without a description there is nothing to rewrite
+        if not exp.description:
+            processed.append(exp)
+            continue
+
         prompt = f"""
         You are an expert resume writer. 
         Analyze the following experience description and convert it into 2-3 highly professional, action-oriented bullet points.
         Do not include any introductory or concluding text, just the bullet points themselves separated by newlines.
         Each bullet point MUST start with an action verb.
         
+        Title: {exp.title}
+        Company: {exp.company}
+        Details: {", ".join(exp.details)}
         Experience:
-        {exp}
+        {exp.description}
         """
         try:
-            response = model.generate_content(prompt)
-            bullets = [b.strip().strip('-* ') for b in response.text.split('\n') if b.strip()]
-            
-            # Reconstruct the experience string with HTML bullets
-            # The original parsing is: parts = exp.split(' | ')
-            # So we keep the title and company, and replace the desc
-            parts = exp.split(' | ')
-            if len(parts) > 5:
-                # Replace the original description with the new bullets
-                bullets_html = "".join([f"<li>{b}</li>" for b in bullets if b])
-                new_exp = " | ".join(parts[:5]) + " | " + f"<ul>{bullets_html}</ul>"
-                processed.append(new_exp)
-            else:
-                processed.append(exp) # Fallback
+            processed.append(with_bullets(exp, _parse_bullets(_generate(prompt))))
         except Exception as e:
             print(f"Error processing experience with Gemini: {e}")
             processed.append(exp)
@@ -52,7 +61,7 @@ def process_projects_with_gemini(projects_list):
 
     processed_projects = []
     for proj in projects_list:
-        desc = proj.get('description', '')
+        desc = proj.description
         if not desc:
             processed_projects.append(proj)
             continue
@@ -64,18 +73,11 @@ def process_projects_with_gemini(projects_list):
         Do not include any introductory or concluding text, just the bullet points themselves separated by newlines.
         Each bullet point MUST start with an action verb.
         
-        Project Name: {proj.get('name', 'Unknown')}
+        Project Name: {proj.name or 'Unknown'}
         Description: {desc}
         """
         try:
-            response = model.generate_content(prompt)
-            bullets = [b.strip().strip('-* ') for b in response.text.split('\n') if b.strip()]
-            bullets_html = "".join([f"<li>{b}</li>" for b in bullets if b])
-            
-            # Update the description with the new HTML bullets
-            new_proj = proj.copy()
-            new_proj['description'] = f"<ul>{bullets_html}</ul>"
-            processed_projects.append(new_proj)
+            processed_projects.append(with_bullets(proj, _parse_bullets(_generate(prompt))))
         except Exception as e:
             print(f"Error processing project with Gemini: {e}")
             processed_projects.append(proj)
@@ -104,8 +106,7 @@ def process_skills_with_gemini(skills_list):
     """
     
     try:
-        response = model.generate_content(prompt)
-        text = response.text.strip()
+        text = _generate(prompt).strip()
         if text.startswith('```json'):
             text = text[7:]
         if text.endswith('```'):
@@ -1,8 +1,11 @@
 import os
+import re
 import json
 import subprocess
 import time
 import base64
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
@@ -12,6 +15,8 @@ from flask_cors import CORS
 from dotenv import load_dotenv
 import google.generativeai as genai
 from analyzer import process_experience_with_gemini, process_projects_with_gemini, process_skills_with_gemini
+from models import GithubProfile, LinkedinProfile, Project, ResumeProfile
+from singleflight import SingleFlight
 
 load_dotenv()
 
@@ -24,6 +29,18 @@ model = genai.GenerativeModel('gemini-2.5-flash')
 # In-memory storage for user data
 user_sessions = {}
 
+# Duplicate /automate requests for the same candidate share one scrape
+scrape_flight = SingleFlight()
+
+# Scrapes started speculatively from /chat as soon as both profile links are known
+prefetch_executor = ThreadPoolExecutor(max_workers=4)
+# Also run the Gemini bullet rewriting and skill categorization in the background
+PREFETCH_ANALYSIS = os.getenv("PREFETCH_ANALYSIS", "1") != "0"
+
+# Only profile links count: github.com/<user>/<repo> is a project, not a profile
+GITHUB_URL_RE = re.compile(r'(?:https?://)?(?:www\.)?github\.com/([A-Za-z0-9-]+)/?(?=[\s?#.,!)]|$)', re.IGNORECASE)
+LINKEDIN_URL_RE = re.compile(r'(?:https?://)?(?:[a-z]{2,3}\.)?linkedin\.com/in/[^\s/?#]+?/?(?=[\s?#.,!)]|$)', re.IGNORECASE)
+
 system_instruction = """
 You are a helpful assistant guiding a user through building their resume.
 Your goal is to collect their: Name, Phone Number, Email, LinkedIn Profile URL, and GitHub Profile URL.
@@ -74,7 +91,10 @@ def chat():
             user_sessions[session_id] = {
                 "chat": chat_session,
                 "is_done": False,
-                "data": None
+                "data": None,
+                "github": None,
+                "linkedin": None,
+                "prefetch": None
             }
 
         session = user_sessions[session_id]
@@ -86,6 +106,10 @@ def chat():
                 "session_data": session["data"]
             })
 
+        # Start scraping as soon as both profile links have been given, so it
+        # overlaps with the rest of the conversation
+        detect_profile_links(session, user_message)
+
         # Send user message to Gemini
         response = session["chat"].send_message(user_message)
         text = response.text.strip()
@@ -100,8 +124,17 @@ def chat():
                     json_str = json_str.split("```")[-1].split("```")[0].strip()
                 
                 parsed_data = json.loads(json_str)
+                # /automate uses this to pick up the background scrape
+                parsed_data["session_id"] = session_id
                 session["is_done"] = True
                 session["data"] = parsed_data
+
+                # Chat detection is URL-only, so a bare username still gets
+                # a head start here before the frontend calls /automate
+                if parsed_data.get("github") and parsed_data.get("linkedin"):
+                    session["github"] = normalize_github_user(parsed_data["github"])
+                    session["linkedin"] = parsed_data["linkedin"]
+                    start_prefetch(session)
                 
                 return jsonify({
                     "response": "Thank you! I have everything I need. Starting automation...",
@@ -123,6 +156,125 @@ def chat():
         print(f"Chat error: {e}")
         return jsonify({"error": str(e)}), 500
 
+def normalize_github_user(github_user):
+    # Accept either a bare username or a profile link
+    github_user = github_user.strip()
+    if "github.com/" in github_user:
+        github_user = github_user.split("github.com/")[-1]
+    return github_user.strip("/").split("/")[0].split("?")[0].lstrip("@")
+
+def linkedin_key(linkedin_url):
+    linkedin_key = linkedin_url.strip().lower().split("?")[0].split("#")[0]
+    for prefix in ("https://", "http://", "www."):
+        if linkedin_key.startswith(prefix):
+            linkedin_key = linkedin_key[len(prefix):]
+    return linkedin_key.rstrip("/")
+
+def scrape_key(github_user, linkedin_url):
+    return (github_user.lower(), linkedin_key(linkedin_url))
+
+def run_scraper(source, value):
+    # Each scrape writes to its own file so concurrent candidates don't clobber each other
+    fd, output_path = tempfile.mkstemp(prefix=f'scraped_{source}_', suffix='.json')
+    os.close(fd)
+    try:
+        subprocess.run(
+            ['python', 'scraper.py', '--source', source, value, output_path],
+            capture_output=True, text=True, check=True
+        )
+        with open(output_path, 'r', encoding='utf-8') as f:
+            return f.read()
+    finally:
+        os.remove(output_path)
+
+def scrape_profile(github_user, linkedin_url):
+    # Each source has its own flight key, so two requests for the same LinkedIn
+    # profile share one Selenium login even if their GitHub values differ.
+    # The flights share raw JSON, every caller parses its own mutable copy.
+    github_json = scrape_flight.do(("github", github_user.lower()), run_scraper, "github", github_user)
+    linkedin_json = scrape_flight.do(("linkedin", linkedin_key(linkedin_url)), run_scraper, "linkedin", linkedin_url)
+    return ResumeProfile.combine(
+        GithubProfile.from_dict(json.loads(github_json)),
+        LinkedinProfile.from_dict(json.loads(linkedin_json))
+    )
+
+def analyze_profile(profile):
+    # Analyze with Gemini mapping
+    print("Processing experiences with Gemini...")
+    profile.linkedin.experience = process_experience_with_gemini(profile.linkedin.experience)
+    
+    print("Processing projects with Gemini...")
+    profile.github.projects = process_projects_with_gemini(profile.github.projects)
+         
+    print("Processing skills with Gemini...")
+    if profile.skills.all:
+         profile.skills.categorized = process_skills_with_gemini(profile.skills.all)
+
+def prefetch_profile(github_user, linkedin_url, analyze):
+    profile = scrape_profile(github_user, linkedin_url)
+    if analyze:
+        analyze_profile(profile)
+    # Returned as JSON so a retried /automate gets its own copy
+    return profile.to_json()
+
+def detect_profile_links(session, message):
+    message = message.strip()
+    # Once a link is known, only a message that is just a new link replaces it,
+    # so project links mentioned later don't restart the scrape
+    github_match = GITHUB_URL_RE.search(message)
+    if github_match and (not session["github"] or GITHUB_URL_RE.fullmatch(message)):
+        session["github"] = github_match.group(1)
+
+    linkedin_match = LINKEDIN_URL_RE.search(message)
+    if linkedin_match and (not session["linkedin"] or LINKEDIN_URL_RE.fullmatch(message)):
+        linkedin_url = linkedin_match.group(0)
+        if not linkedin_url.lower().startswith("http"):
+            linkedin_url = "https://" + linkedin_url
+        session["linkedin"] = linkedin_url
+
+    start_prefetch(session)
+
+def log_prefetch_failure(future):
+    if not future.cancelled() and future.exception():
+        print(f"Background scrape failed: {future.exception()}")
+
+def start_prefetch(session):
+    if not session["github"] or not session["linkedin"]:
+        return
+
+    key = scrape_key(session["github"], session["linkedin"])
+    if session["prefetch"] and session["prefetch"]["key"] == key:
+        return
+
+    if session["prefetch"]:
+        # Frees the worker if the stale job is still queued; a scrape that is
+        # already running cannot be stopped and is left to finish
+        session["prefetch"]["future"].cancel()
+
+    print(f"Starting background scrape for {session['github']} and {session['linkedin']}")
+    future = prefetch_executor.submit(prefetch_profile, session["github"], session["linkedin"], PREFETCH_ANALYSIS)
+    future.add_done_callback(log_prefetch_failure)
+    session["prefetch"] = {
+        "key": key,
+        "analyzed": PREFETCH_ANALYSIS,
+        "future": future
+    }
+
+def take_prefetched_profile(session_id, github_user, linkedin_url):
+    session = user_sessions.get(session_id)
+    prefetch = session.get("prefetch") if session else None
+    if not prefetch or prefetch["key"] != scrape_key(github_user, linkedin_url):
+        return None, False
+
+    # Waits if the background scrape is still running
+    try:
+        profile = ResumeProfile.from_json(prefetch["future"].result())
+    except Exception as e:
+        print(f"Background scrape failed, scraping again: {e}")
+        session["prefetch"] = None
+        return None, False
+    return profile, prefetch["analyzed"]
+
 @app.route('/automate', methods=['POST'])
 def automate():
     session_data = request.json
@@ -133,40 +285,25 @@ def automate():
         return jsonify({"error": "Missing GitHub or LinkedIn info"}), 400
 
     # Clean github username if link was provided
-    if "github.com/" in github_user:
-        github_user = github_user.split("github.com/")[-1].strip("/")
+    github_user = normalize_github_user(github_user)
 
-    print(f"Running scraper for {github_user} and {linkedin_url}")
+    print(f"Preparing resume for {github_user} and {linkedin_url}")
     
     try:
-        # Run the existing scraper script
-        result = subprocess.run(
-            ['python', 'scraper.py', github_user, linkedin_url],
-            capture_output=True, text=True, check=True
-        )
-        
-        # Load the scraped data
-        with open('scraped_data.json', 'r') as f:
-            scraped_data = json.load(f)
-            
-        # Analyze with Gemini mapping
-        print("Processing experiences with Gemini...")
-        if 'linkedin' in scraped_data and 'experience' in scraped_data['linkedin']:
-            scraped_data['linkedin']['experience'] = process_experience_with_gemini(scraped_data['linkedin']['experience'])
-        
-        print("Processing projects with Gemini...")
-        if 'github' in scraped_data and 'projects' in scraped_data['github']:
-             scraped_data['github']['projects'] = process_projects_with_gemini(scraped_data['github']['projects'])
+        # Reuse the scrape started during the chat, if it is for the same profiles
+        profile, analyzed = take_prefetched_profile(session_data.get('session_id', 'default'), github_user, linkedin_url)
+        if profile is None:
+            # Run the existing scraper script
+            profile = scrape_profile(github_user, linkedin_url)
+
+        if not analyzed:
+            analyze_profile(profile)
              
-        if 'custom_projects' in session_data:
-             session_data['custom_projects'] = process_projects_with_gemini(session_data['custom_projects'])
-             
-        print("Processing skills with Gemini...")
-        if 'final_skills' in scraped_data:
-             scraped_data['categorized_skills'] = process_skills_with_gemini(scraped_data['final_skills'])
+        custom_projects = [Project.from_custom(p) for p in session_data.get('custom_projects') or []]
+        custom_projects = process_projects_with_gemini(custom_projects)
             
         # Fill the template
-        generate_resume(scraped_data, session_data)
+        generate_resume(profile, session_data, custom_projects)
         
         print("Converting HTML to PDF...")
         generate_pdf_from_html('final_resume.html', 'final_resume.pdf')
@@ -175,19 +312,22 @@ def automate():
     except Exception as e:
         return jsonify({"status": "error", "message": str(e)}), 500
 
-def generate_resume(scraped_data, session_data):
+def bullets_to_html(bullets):
+    return "<ul>" + "".join(f"<li>{b}</li>" for b in bullets) + "</ul>"
+
+def generate_resume(profile, session_data, custom_projects=None):
     # Load template
     with open('resume_template.html', 'r', encoding='utf-8') as f:
         template = f.read()
 
-    gh_profile = scraped_data.get('github', {})
-    li_profile = scraped_data.get('linkedin', {})
+    gh_profile = profile.github
+    li_profile = profile.linkedin
 
-    name = session_data.get('name') or gh_profile.get('name') or li_profile.get('name') or "Your Name"
+    name = session_data.get('name') or gh_profile.name or li_profile.name or "Your Name"
     phone = session_data.get('phone') or "Your Phone"
     email = session_data.get('email') or "Your Email"
-    linkedin_url = session_data.get('linkedin') or li_profile.get('headline', 'LinkedIn Profile')
-    github_url = session_data.get('github') or f"github.com/{gh_profile.get('name', 'profile')}"
+    linkedin_url = session_data.get('linkedin') or li_profile.headline or 'LinkedIn Profile'
+    github_url = session_data.get('github') or f"github.com/{gh_profile.name or 'profile'}"
 
     # Simple placeholder replacement logic
     replacements = {
@@ -200,14 +340,13 @@ def generate_resume(scraped_data, session_data):
 
     # Replace Experience
     experience_html = ""
-    for exp in li_profile.get('experience', []):
-        parts = exp.split(' | ')
-        title = parts[0] if len(parts) > 0 else "Experience"
-        company = parts[1] if len(parts) > 1 else ""
-        date = parts[4] if len(parts) > 4 else ""
-        desc = " ".join(parts[5:]) if len(parts) > 5 else ""
+    for exp in li_profile.experience:
+        title = exp.title or "Experience"
+        company = exp.company
+        date = exp.date
+        desc = bullets_to_html(exp.bullets) if exp.bullets else exp.description
+        details = " · ".join(exp.details)
         
-        # Gemini has already returned nicely formatted HTML inside the bullet points for `desc`
         experience_html += f"""
         <div class="item">
             <div class="item-header">
@@ -216,24 +355,24 @@ def generate_resume(scraped_data, session_data):
             </div>
             <div class="item-sub-header">
                 <span>{company}</span>
+                <span class="item-location">{details}</span>
             </div>
             {desc}
         </div>
         """
     
     if experience_html:
-        import re
         template = re.sub(r'(<section id="experience">.*?)<h2>Experience</h2>.*?<section id="projects">', 
                           r'\1<h2>Experience</h2>' + experience_html + '<section id="projects">', 
                           template, flags=re.DOTALL)
 
     # Replace Education
     education_html = ""
-    for edu in li_profile.get('education', []):
-        parts = edu.split(' | ')
-        school = parts[0] if len(parts) > 0 else "University"
-        degree = parts[2] if len(parts) > 2 else ""
-        date = parts[4] if len(parts) > 4 else ""
+    for edu in li_profile.education:
+        school = edu.school or "University"
+        degree = edu.degree
+        date = edu.date
+        details = " · ".join(edu.details)
         
         education_html += f"""
         <div class="item">
@@ -243,11 +382,11 @@ def generate_resume(scraped_data, session_data):
             </div>
             <div class="item-sub-header">
                 <span>{degree}</span>
+                <span class="item-location">{details}</span>
             </div>
         </div>
         """
     if education_html:
-        import re
         template = re.sub(r'(<section id="education">.*?)<h2>Education</h2>.*?<section id="experience">', 
                           r'\1<h2>Education</h2>' + education_html + '<section id="experience">', 
                           template, flags=re.DOTALL)
@@ -256,31 +395,25 @@ def generate_resume(scraped_data, session_data):
     projects_html = ""
     
     # 1. Top 3 from GitHub
-    gh_projects = gh_profile.get('projects', [])
-    try:
-        gh_projects.sort(key=lambda x: int(x.get('stars', '0').replace(',', '') if str(x.get('stars', '')).replace(',', '').isdigit() else 0), reverse=True)
-    except Exception:
-        pass
+    gh_projects = sorted(gh_profile.projects, key=lambda x: x.stars, reverse=True)
 
     for p in gh_projects[:3]:
         # Formulate date display
-        start = p.get('created_at', '')
-        end = p.get('pushed_at', '')
+        start = p.created_at
+        end = p.pushed_at
         date_display = f"{start} - {end}" if start and end else "Dates Unavailable"
         
         # Determine language info
-        lang = p.get('language', '')
+        lang = p.language
         lang_display = f" | <i>{lang}</i>" if lang else ""
         
-        experience_desc = p.get('description') or '<ul><li>No description provided.</li></ul>'
-        if not str(experience_desc).startswith("<ul>"):
-             experience_desc = f"<ul><li>{experience_desc}</li></ul>"
+        experience_desc = bullets_to_html(p.bullets or [p.description or 'No description provided.'])
              
 
         projects_html += f"""
         <div class="item">
             <div class="item-header">
-                <span class="item-name"><a href="{p.get('url', '#')}">{p.get('name', 'Project')}</a>{lang_display}</span>
+                <span class="item-name"><a href="{p.url or '#'}">{p.name or 'Project'}</a>{lang_display}</span>
                 <span class="item-date">{date_display}</span>
             </div>
             {experience_desc}
@@ -288,32 +421,28 @@ def generate_resume(scraped_data, session_data):
         """
 
     # 2. Add 1 extra custom project from user input
-    custom_projects = session_data.get('custom_projects', [])
-    if custom_projects and len(custom_projects) > 0:
+    if custom_projects:
         cp = custom_projects[0]
         
-        desc = cp.get('description', 'No description provided.')
-        if not str(desc).startswith("<ul>"):
-            desc = f"<ul><li>{desc}</li></ul>"
+        desc = bullets_to_html(cp.bullets or [cp.description or 'No description provided.'])
             
         projects_html += f"""
         <div class="item">
             <div class="item-header">
-                <span class="item-name">{cp.get('name', 'Custom Project')}</span>
-                <span class="item-date"><a href="{cp.get('link', '#')}">Link</a></span>
+                <span class="item-name">{cp.name or 'Custom Project'}</span>
+                <span class="item-date"><a href="{cp.url or '#'}">Link</a></span>
             </div>
             {desc}
         </div>
         """
 
     if projects_html:
-        import re
         template = re.sub(r'(<section id="projects">.*?)<h2>Projects</h2>.*?<section id="skills">', 
                           r'\1<h2>Projects</h2>' + projects_html + '<section id="skills">', 
                           template, flags=re.DOTALL)
 
     # Replace Skills
-    categorized_skills = scraped_data.get('categorized_skills', {})
+    categorized_skills = profile.skills.categorized
     skills_html = ""
     for category, skills in categorized_skills.items():
         if skills:
@@ -321,10 +450,9 @@ def generate_resume(scraped_data, session_data):
     
     if not skills_html:
          # Fallback
-         skills_list = scraped_data.get('final_skills', [])
+         skills_list = profile.skills.all
          skills_html = f"<p><b>Skills:</b> {', '.join(skills_list)}</p>"
          
-    import re
     template = re.sub(r'(<section id="skills">.*?)<h2>Technical Skills</h2>.*?</div>', 
                       r'\1<h2>Technical Skills</h2><div class="skills-container">' + skills_html + '</div>', 
                       template, flags=re.DOTALL)
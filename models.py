@@ -0,0 +1,316 @@
+import json
+import time
+from dataclasses import dataclass, field, replace
+from typing import Dict, List, Optional
+
+# LinkedIn list items are scraped with get_text(separator=" | "), which yields
+# positional fragments. They are parsed exactly once here so that every later
+# stage works with named fields instead of re-splitting strings.
+# dataclass(slots=True) needs Python 3.10 or newer.
+SEPARATOR = " | "
+
+
+def _split(text):
+    return (text or "").split(SEPARATOR)
+
+
+def _part(parts, index):
+    return parts[index] if len(parts) > index else ""
+
+
+def _extra(parts, indexes, known):
+    # Keep fragments outside the named fields, minus LinkedIn's repeated
+    # screen-reader copies of the title, company or dates
+    extra = []
+    for i in indexes:
+        p = _part(parts, i)
+        if p and p not in known and p not in extra:
+            extra.append(p)
+    return extra
+
+
+@dataclass(slots=True)
+class Experience:
+    title: str = ""
+    company: str = ""
+    date: str = ""
+    description: str = ""
+    details: List[str] = field(default_factory=list)
+    bullets: List[str] = field(default_factory=list)
+
+    @classmethod
+    def from_text(cls, text):
+        """Build an entry from a " | "-joined LinkedIn list item.
+
+        This still guesses fields by fragment position (0 title, 1 company,
+        4 dates, 5+ description), as the scraper did before. Other fragments
+        are kept in details so nothing is silently dropped.
+        """
+        parts = _split(text)
+        title, company, date = _part(parts, 0), _part(parts, 1), _part(parts, 4)
+        return cls(
+            title=title,
+            company=company,
+            date=date,
+            description=" ".join(parts[5:]),
+            # Fragments 2 and 3 have no fixed meaning (often employment type or location)
+            details=_extra(parts, (2, 3), (title, company, date)),
+        )
+
+    def to_dict(self):
+        return {
+            "title": self.title,
+            "company": self.company,
+            "date": self.date,
+            "description": self.description,
+            "details": self.details,
+            "bullets": self.bullets,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            title=data.get("title", ""),
+            company=data.get("company", ""),
+            date=data.get("date", ""),
+            description=data.get("description", ""),
+            details=list(data.get("details", [])),
+            bullets=list(data.get("bullets", [])),
+        )
+
+
+@dataclass(slots=True)
+class Education:
+    school: str = ""
+    degree: str = ""
+    date: str = ""
+    details: List[str] = field(default_factory=list)
+
+    @classmethod
+    def from_text(cls, text):
+        """Build an entry from a " | "-joined LinkedIn list item.
+
+        This still guesses fields by fragment position (0 school, 2 degree,
+        4 dates). Other fragments are kept in details.
+        """
+        parts = _split(text)
+        school, degree, date = _part(parts, 0), _part(parts, 2), _part(parts, 4)
+        return cls(
+            school=school,
+            degree=degree,
+            date=date,
+            details=_extra(parts, [1, 3] + list(range(5, len(parts))), (school, degree, date)),
+        )
+
+    def to_dict(self):
+        return {
+            "school": self.school,
+            "degree": self.degree,
+            "date": self.date,
+            "details": self.details,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            school=data.get("school", ""),
+            degree=data.get("degree", ""),
+            date=data.get("date", ""),
+            details=list(data.get("details", [])),
+        )
+
+
+@dataclass(slots=True)
+class Project:
+    name: str = ""
+    description: str = ""
+    url: str = ""
+    stars: int = 0
+    language: str = ""
+    created_at: str = ""
+    pushed_at: str = ""
+    bullets: List[str] = field(default_factory=list)
+
+    @classmethod
+    def from_github(cls, repo):
+        return cls(
+            name=repo["name"],
+            description=repo["description"] or "",
+            url=repo["html_url"],
+            stars=repo["stargazers_count"] or 0,
+            language=repo["language"] or "",
+            created_at=repo.get("created_at", "").split("T")[0] if repo.get("created_at") else "",
+            pushed_at=repo.get("pushed_at", "").split("T")[0] if repo.get("pushed_at") else "",
+        )
+
+    @classmethod
+    def from_custom(cls, data):
+        # Custom projects come from the chat JSON, which calls the URL "link"
+        return cls(
+            name=data.get("name") or "",
+            description=data.get("description") or "",
+            url=data.get("link") or "",
+        )
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "description": self.description,
+            "url": self.url,
+            "stars": self.stars,
+            "language": self.language,
+            "created_at": self.created_at,
+            "pushed_at": self.pushed_at,
+            "bullets": self.bullets,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            name=data.get("name", ""),
+            description=data.get("description", ""),
+            url=data.get("url", ""),
+            stars=data.get("stars", 0),
+            language=data.get("language", ""),
+            created_at=data.get("created_at", ""),
+            pushed_at=data.get("pushed_at", ""),
+            bullets=list(data.get("bullets", [])),
+        )
+
+
+@dataclass(slots=True)
+class Skills:
+    all: List[str] = field(default_factory=list)
+    categorized: Dict[str, List[str]] = field(default_factory=dict)
+
+    @classmethod
+    def merge(cls, *skill_lists):
+        # Combined and deduplicated list (case-insensitive deduplication)
+        combined = {}
+        for skills in skill_lists:
+            for s in skills:
+                if s:
+                    combined[s.lower()] = s
+        return cls(all=sorted(combined.values()))
+
+    def to_dict(self):
+        return {"all": self.all, "categorized": self.categorized}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            all=list(data.get("all", [])),
+            categorized={k: list(v) for k, v in data.get("categorized", {}).items()},
+        )
+
+
+@dataclass(slots=True)
+class GithubProfile:
+    name: str = ""
+    bio: str = ""
+    location: str = ""
+    public_repos: int = 0
+    projects: List[Project] = field(default_factory=list)
+    skills: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "bio": self.bio,
+            "location": self.location,
+            "public_repos": self.public_repos,
+            "projects": [p.to_dict() for p in self.projects],
+            "skills": self.skills,
+            "error": self.error,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            name=data.get("name", ""),
+            bio=data.get("bio", ""),
+            location=data.get("location", ""),
+            public_repos=data.get("public_repos", 0),
+            projects=[Project.from_dict(p) for p in data.get("projects", [])],
+            skills=list(data.get("skills", [])),
+            error=data.get("error"),
+        )
+
+
+@dataclass(slots=True)
+class LinkedinProfile:
+    name: str = ""
+    headline: str = ""
+    experience: List[Experience] = field(default_factory=list)
+    education: List[Education] = field(default_factory=list)
+    skills: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "headline": self.headline,
+            "experience": [e.to_dict() for e in self.experience],
+            "education": [e.to_dict() for e in self.education],
+            "skills": self.skills,
+            "error": self.error,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            name=data.get("name", ""),
+            headline=data.get("headline", ""),
+            experience=[Experience.from_dict(e) for e in data.get("experience", [])],
+            education=[Education.from_dict(e) for e in data.get("education", [])],
+            skills=list(data.get("skills", [])),
+            error=data.get("error"),
+        )
+
+
+@dataclass(slots=True)
+class ResumeProfile:
+    github: GithubProfile = field(default_factory=GithubProfile)
+    linkedin: LinkedinProfile = field(default_factory=LinkedinProfile)
+    skills: Skills = field(default_factory=Skills)
+    timestamp: str = ""
+
+    def to_dict(self):
+        return {
+            "github": self.github.to_dict(),
+            "linkedin": self.linkedin.to_dict(),
+            "skills": self.skills.to_dict(),
+            "timestamp": self.timestamp,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            github=GithubProfile.from_dict(data.get("github", {})),
+            linkedin=LinkedinProfile.from_dict(data.get("linkedin", {})),
+            skills=Skills.from_dict(data.get("skills", {})),
+            timestamp=data.get("timestamp", ""),
+        )
+
+    @classmethod
+    def combine(cls, github, linkedin):
+        return cls(
+            github=github,
+            linkedin=linkedin,
+            # Merge skills
+            skills=Skills.merge(github.skills, linkedin.skills),
+            timestamp=time.strftime("%Y-%m-%d %H:%M:%S"),
+        )
+
+    def to_json(self):
+        # Hand-written to_dict avoids the deep copy done by dataclasses.asdict
+        return json.dumps(self.to_dict(), separators=(",", ":"), ensure_ascii=False)
+
+    @classmethod
+    def from_json(cls, text):
+        return cls.from_dict(json.loads(text))
+
+
+def with_bullets(record, bullets):
+    return replace(record, bullets=list(bullets))
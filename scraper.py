@@ -11,6 +11,7 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from webdriver_manager.chrome import ChromeDriverManager
 from bs4 import BeautifulSoup
+from models import Education, Experience, GithubProfile, LinkedinProfile, Project, ResumeProfile
 
 # Load environment variables
 if os.path.exists(".env"):
@@ -37,7 +38,7 @@ class ResumeScraper:
         profile_url = f"https://api.github.com/users/{username}"
         profile_resp = requests.get(profile_url, headers=headers)
         if profile_resp.status_code != 200:
-            return {"error": f"GitHub user not found or API limit reached ({profile_resp.status_code})"}
+            return GithubProfile(error=f"GitHub user not found or API limit reached ({profile_resp.status_code})")
         
         profile_data = profile_resp.json()
         
@@ -50,30 +51,22 @@ class ResumeScraper:
         languages = set()
         for repo in repos_data:
             if not repo["fork"]:
-                projects.append({
-                    "name": repo["name"],
-                    "description": repo["description"],
-                    "url": repo["html_url"],
-                    "stars": repo["stargazers_count"],
-                    "language": repo["language"],
-                    "created_at": repo.get("created_at", "").split("T")[0] if repo.get("created_at") else "",
-                    "pushed_at": repo.get("pushed_at", "").split("T")[0] if repo.get("pushed_at") else ""
-                })
+                projects.append(Project.from_github(repo))
                 if repo["language"]:
                     languages.add(repo["language"])
 
-        return {
-            "name": profile_data.get("name"),
-            "bio": profile_data.get("bio"),
-            "location": profile_data.get("location"),
-            "public_repos": profile_data.get("public_repos"),
-            "projects": projects,
-            "skills": list(languages)
-        }
+        return GithubProfile(
+            name=profile_data.get("name") or "",
+            bio=profile_data.get("bio") or "",
+            location=profile_data.get("location") or "",
+            public_repos=profile_data.get("public_repos") or 0,
+            projects=projects,
+            skills=list(languages)
+        )
 
     def scrape_linkedin(self, profile_url):
         if not self.linkedin_email or not self.linkedin_password:
-            return {"error": "LinkedIn credentials (LINKEDIN_EMAIL, LINKEDIN_PASSWORD) missing in .env"}
+            return LinkedinProfile(error="LinkedIn credentials (LINKEDIN_EMAIL, LINKEDIN_PASSWORD) missing in .env")
 
         print(f"Scraping LinkedIn for {profile_url}...")
         
@@ -121,7 +114,7 @@ class ResumeScraper:
                 list_items = exp_section.find_parent("section").find_all("li", class_="artdeco-list__item")
                 for item in list_items:
                     text = item.get_text(separator=" | ", strip=True)
-                    experience.append(text)
+                    experience.append(Experience.from_text(text))
 
             # Education section
             education = []
@@ -130,7 +123,7 @@ class ResumeScraper:
                 list_items = edu_section.find_parent("section").find_all("li", class_="artdeco-list__item")
                 for item in list_items:
                     text = item.get_text(separator=" | ", strip=True)
-                    education.append(text)
+                    education.append(Education.from_text(text))
 
             # Skills section
             skills = []
@@ -173,49 +166,50 @@ class ResumeScraper:
             except Exception as e:
                 print(f"Details skills page failed: {e}")
 
-            return {
-                "name": name,
-                "headline": headline,
-                "experience": experience,
-                "education": education,
-                "skills": sorted(list(set(skills))) 
-            }
+            return LinkedinProfile(
+                name=name,
+                headline=headline,
+                experience=experience,
+                education=education,
+                skills=sorted(list(set(skills)))
+            )
 
         except Exception as e:
-            return {"error": f"LinkedIn scraping failed: {str(e)}"}
+            return LinkedinProfile(error=f"LinkedIn scraping failed: {str(e)}")
         finally:
             driver.quit()
 
 if __name__ == "__main__":
     # Example usage
     import sys
-    if len(sys.argv) < 3:
-        print("Usage: python scraper.py [github_username] [linkedin_url]")
+    if len(sys.argv) >= 4 and sys.argv[1] == "--source":
+        # Scrape a single source so callers can share one scrape per profile
+        source, value = sys.argv[2], sys.argv[3]
+        output_path = sys.argv[4] if len(sys.argv) > 4 else f"scraped_{source}.json"
+        scraper = ResumeScraper()
+        if source == "github":
+            data = scraper.scrape_github(value)
+        elif source == "linkedin":
+            data = scraper.scrape_linkedin(value)
+        else:
+            sys.exit(f"Unknown source: {source}")
+
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(data.to_dict(), f, separators=(",", ":"), ensure_ascii=False)
+
+        print(f"Data saved to {output_path}.")
+    elif len(sys.argv) < 3:
+        print("Usage: python scraper.py [github_username] [linkedin_url] [output_path]")
+        print("       python scraper.py --source [github|linkedin] [username_or_url] [output_path]")
     else:
+        output_path = sys.argv[3] if len(sys.argv) > 3 else "scraped_data.json"
         scraper = ResumeScraper()
         gh_data = scraper.scrape_github(sys.argv[1])
         li_data = scraper.scrape_linkedin(sys.argv[2])
         
-        # Merge skills
-        gh_skills = gh_data.get("skills", [])
-        li_skills = li_data.get("skills", [])
-        
-        # Combined and deduplicated list (case-insensitive deduplication)
-        combined_skills_map = {}
-        for s in gh_skills + li_skills:
-            if s:
-                combined_skills_map[s.lower()] = s
-        
-        final_skills = sorted(list(combined_skills_map.values()))
-
-        combined_data = {
-            "github": gh_data,
-            "linkedin": li_data,
-            "final_skills": final_skills,
-            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
-        }
+        profile = ResumeProfile.combine(gh_data, li_data)
         
-        with open("scraped_data.json", "w") as f:
-            json.dump(combined_data, f, indent=4)
+        with open(output_path, "w", encoding="utf-8") as f:
+            f.write(profile.to_json())
         
-        print(f"Data saved to scraped_data.json. Total skills: {len(final_skills)}")
+        print(f"Data saved to {output_path}. Total skills: {len(profile.skills.all)}")
@@ -0,0 +1,144 @@
+import json
+from concurrent.futures import Future
+
+import pytest
+
+pytest.importorskip("flask")
+
+import app
+from models import GithubProfile, LinkedinProfile, ResumeProfile
+
+LINKEDIN = "https://www.linkedin.com/in/jdoe/"
+
+
+def make_session(**values):
+    session = {"github": None, "linkedin": None, "prefetch": None}
+    session.update(values)
+    return session
+
+
+def done_future(result=None, error=None):
+    future = Future()
+    if error:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+    return future
+
+
+@pytest.fixture
+def scrapes(monkeypatch):
+    calls = []
+
+    def fake_run_scraper(source, value):
+        calls.append((source, value))
+        profile = GithubProfile(name=value) if source == "github" else LinkedinProfile(name=value)
+        return json.dumps(profile.to_dict())
+
+    monkeypatch.setattr(app, "run_scraper", fake_run_scraper)
+    return calls
+
+
+@pytest.fixture
+def client(monkeypatch, scrapes):
+    monkeypatch.setattr(app, "analyze_profile", lambda profile: None)
+    monkeypatch.setattr(app, "generate_resume", lambda *args: None)
+    monkeypatch.setattr(app, "generate_pdf_from_html", lambda *args: None)
+    monkeypatch.setattr(app, "user_sessions", {})
+    return app.app.test_client()
+
+
+def test_github_regex_ignores_repository_links():
+    assert app.GITHUB_URL_RE.search("my project is https://github.com/facebook/react") is None
+    assert app.GITHUB_URL_RE.search("https://github.com/octocat/").group(1) == "octocat"
+    assert app.GITHUB_URL_RE.search("https://github.com/octocat?tab=repositories").group(1) == "octocat"
+
+
+@pytest.mark.parametrize("message", [
+    "linkedin.com/in/jdoe, thanks",
+    "linkedin.com/in/jdoe.",
+    "(linkedin.com/in/jdoe)",
+    "https://www.linkedin.com/in/jdoe/!",
+])
+def test_linkedin_regex_drops_trailing_punctuation(message):
+    assert app.LINKEDIN_URL_RE.search(message).group(0).rstrip("/").endswith("/in/jdoe")
+
+
+def test_normalize_github_user_and_scrape_key():
+    assert app.normalize_github_user(" https://github.com/OctoCat/ ") == "OctoCat"
+    assert app.normalize_github_user("@octocat") == "octocat"
+    assert app.scrape_key("OctoCat", LINKEDIN) == app.scrape_key("octocat", "linkedin.com/in/jdoe?trk=x")
+
+
+def test_link_in_a_sentence_does_not_replace_known_github(scrapes):
+    session = make_session(github="octocat")
+    app.detect_profile_links(session, "my project is https://github.com/hubot and it's great")
+    assert session["github"] == "octocat"
+
+
+def test_message_with_only_a_link_replaces_known_github(monkeypatch):
+    monkeypatch.setattr(app, "start_prefetch", lambda session: None)
+    session = make_session(github="octocat")
+    app.detect_profile_links(session, "https://github.com/hubot")
+    assert session["github"] == "hubot"
+
+
+@pytest.mark.parametrize("answer", ["yes", "no", "skip", "octocat", "5551234567"])
+def test_bare_answers_do_not_start_prefetch(scrapes, answer):
+    session = make_session(linkedin=LINKEDIN)
+    app.detect_profile_links(session, answer)
+    assert session["github"] is None
+    assert session["prefetch"] is None
+    assert scrapes == []
+
+
+def test_new_key_cancels_queued_prefetch(monkeypatch):
+    submitted = []
+
+    def fake_submit(*args):
+        # Never started, like a job still waiting for a free worker
+        submitted.append(Future())
+        return submitted[-1]
+
+    monkeypatch.setattr(app.prefetch_executor, "submit", fake_submit)
+    session = make_session(github="octocat", linkedin=LINKEDIN)
+    app.start_prefetch(session)
+    session["github"] = "hubot"
+    app.start_prefetch(session)
+    assert submitted[0].cancelled()
+    assert not submitted[1].cancelled()
+
+
+def test_automate_reuses_finished_prefetch(client, scrapes):
+    profile = ResumeProfile(github=GithubProfile(name="octocat"))
+    app.user_sessions["s1"] = make_session(prefetch={
+        "key": app.scrape_key("octocat", LINKEDIN),
+        "analyzed": True,
+        "future": done_future(profile.to_json()),
+    })
+    resp = client.post("/automate", json={"session_id": "s1", "github": "github.com/octocat", "linkedin": LINKEDIN})
+    assert resp.get_json()["status"] == "success"
+    assert scrapes == []
+
+
+def test_automate_scrapes_on_key_mismatch(client, scrapes):
+    app.user_sessions["s1"] = make_session(prefetch={
+        "key": app.scrape_key("someone-else", LINKEDIN),
+        "analyzed": True,
+        "future": done_future(ResumeProfile().to_json()),
+    })
+    resp = client.post("/automate", json={"session_id": "s1", "github": "octocat", "linkedin": LINKEDIN})
+    assert resp.get_json()["status"] == "success"
+    assert scrapes == [("github", "octocat"), ("linkedin", LINKEDIN)]
+
+
+def test_automate_rescrapes_after_failed_prefetch(client, scrapes):
+    app.user_sessions["s1"] = make_session(prefetch={
+        "key": app.scrape_key("octocat", LINKEDIN),
+        "analyzed": True,
+        "future": done_future(error=RuntimeError("selenium crashed")),
+    })
+    resp = client.post("/automate", json={"session_id": "s1", "github": "octocat", "linkedin": LINKEDIN})
+    assert resp.get_json()["status"] == "success"
+    assert scrapes == [("github", "octocat"), ("linkedin", LINKEDIN)]
+    assert app.user_sessions["s1"]["prefetch"] is None
@@ -0,0 +1,39 @@
+from models import Education, Experience, GithubProfile, LinkedinProfile, Project, ResumeProfile, Skills
+
+
+def test_experience_from_text_keeps_extra_fragments():
+    exp = Experience.from_text("Engineer | Acme | Full-time | Acme | Jan 2020 - Present | Built things | Shipped")
+    assert exp.title == "Engineer"
+    assert exp.company == "Acme"
+    assert exp.date == "Jan 2020 - Present"
+    assert exp.description == "Built things Shipped"
+    assert exp.details == ["Full-time"]
+
+
+def test_education_from_text_keeps_extra_fragments():
+    edu = Education.from_text("MIT | MIT | BSc Computer Science | Honours | 2015 - 2019 | GPA 3.9")
+    assert (edu.school, edu.degree, edu.date) == ("MIT", "BSc Computer Science", "2015 - 2019")
+    assert edu.details == ["Honours", "GPA 3.9"]
+
+
+def test_resume_profile_json_round_trip():
+    profile = ResumeProfile(
+        github=GithubProfile(name="Octo", projects=[Project(name="repo", stars=5, bullets=["Built it"])]),
+        linkedin=LinkedinProfile(
+            experience=[Experience.from_text("Engineer | Acme | x | y | 2020 | Did work")],
+            education=[Education.from_text("MIT | a | BSc | b | 2019")],
+        ),
+        skills=Skills(all=["Python"], categorized={"Language": ["Python"]}),
+        timestamp="2024-01-01 00:00:00",
+    )
+    assert ResumeProfile.from_json(profile.to_json()) == profile
+
+
+def test_skills_merge_is_case_insensitive():
+    assert Skills.merge(["Python", "Go"], ["python", ""]).all == ["Go", "python"]
+
+
+def test_combine_merges_source_skills():
+    profile = ResumeProfile.combine(GithubProfile(skills=["Python"]), LinkedinProfile(skills=["Docker"]))
+    assert profile.skills.all == ["Docker", "Python"]
+    assert profile.timestamp
@@ -0,0 +1,79 @@
+import threading
+import time
+
+import pytest
+
+from singleflight import SingleFlight
+
+
+def _run_concurrently(n, target):
+    threads = [threading.Thread(target=target) for _ in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+
+def test_concurrent_calls_share_one_run():
+    flight = SingleFlight()
+    calls = []
+    results = []
+
+    def work():
+        calls.append(1)
+        time.sleep(0.2)
+        return "result"
+
+    _run_concurrently(5, lambda: results.append(flight.do("key", work)))
+
+    assert len(calls) == 1
+    assert results == ["result"] * 5
+
+
+def test_errors_are_shared_and_not_cached():
+    flight = SingleFlight()
+    errors = []
+
+    def fail():
+        time.sleep(0.2)
+        raise ValueError("boom")
+
+    def call():
+        try:
+            flight.do("key", fail)
+        except ValueError as e:
+            errors.append(e)
+
+    _run_concurrently(3, call)
+
+    assert len(errors) == 3
+    assert flight.do("key", lambda: "fresh") == "fresh"
+
+
+def test_different_keys_run_separately():
+    flight = SingleFlight()
+    started = {"a": threading.Event(), "b": threading.Event()}
+    results = {}
+
+    def work(key, other):
+        started[key].set()
+        # Would time out if "b" were blocked behind "a" or vice versa
+        assert started[other].wait(timeout=2)
+        return key
+
+    threads = [
+        threading.Thread(target=lambda: results.update(a=flight.do("a", work, "a", "b"))),
+        threading.Thread(target=lambda: results.update(b=flight.do("b", work, "b", "a"))),
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert results == {"a": "a", "b": "b"}
+
+
+def test_exceptions_pass_through():
+    flight = SingleFlight()
+    with pytest.raises(KeyError):
+        flight.do("c", lambda: {}["missing"])